@@ -41,6 +41,12 @@ class BaseDeviceV1(BluettiDevice):
             ReadableRegisters(17, 4),
         ]
 
+    def get_identity_registers(self) -> List[ReadableRegisters]:
+        # Covers type (10-15) and serial number (17-20) in one request
+        return [
+            ReadableRegisters(10, 11),
+        ]
+
     def get_iot_version(self) -> int:
         return 1
 
@@ -37,6 +37,12 @@ class BaseDeviceV2(BluettiDevice):
             ReadableRegisters(116, 4),
         ]
 
+    def get_identity_registers(self) -> List[ReadableRegisters]:
+        # Covers type (110-115) and serial number (116-119) in one request
+        return [
+            ReadableRegisters(110, 10),
+        ]
+
     def get_iot_version(self) -> int:
         return 2
 
@@ -1,8 +1,42 @@
+from bisect import bisect_left
 from typing import Any, List
 
 from ..registers import ReadableRegisters, WriteableRegister
 from ..fields import DeviceField, BoolField, BoolFieldNonZero, SwitchField, SelectField
 
+_REGISTER_GAP_TOLERANCE = 8
+"""Largest gap (in registers) bridged when merging adjacent reads"""
+
+_MAX_READ_QUANTITY = 125
+"""MODBUS limit on registers per read request"""
+
+
+def _merge_readable_registers(
+    fields: List[DeviceField],
+) -> List[ReadableRegisters]:
+    """Coalesce address-sorted fields into as few read requests as possible
+
+    Every read costs a full BLE round-trip, so reading a few unused
+    registers to bridge a small gap is cheaper than a separate request.
+    """
+    groups: List[ReadableRegisters] = []
+    start = end = None
+    for f in fields:
+        field_end = f.address + f.size
+        if start is None:
+            start, end = f.address, field_end
+        elif (
+            f.address - end <= _REGISTER_GAP_TOLERANCE
+            and field_end - start <= _MAX_READ_QUANTITY
+        ):
+            end = max(end, field_end)
+        else:
+            groups.append(ReadableRegisters(start, end - start))
+            start, end = f.address, field_end
+    if start is not None:
+        groups.append(ReadableRegisters(start, end - start))
+    return groups
+
 
 class BluettiDevice:
     def __init__(
@@ -18,21 +52,22 @@ class BluettiDevice:
         self.fields.sort(key=lambda f: f.address)
         self.pack_fields.sort(key=lambda f: f.address)
 
-        self.polling_registers: List[ReadableRegisters] = []
-        self.pack_polling_registers: List[ReadableRegisters] = []
+        # Combined address-sorted index so parse() can select the fields
+        # covered by a response via bisect instead of scanning all fields
+        self._parse_fields = sorted(
+            self.fields + self.pack_fields, key=lambda f: f.address
+        )
+        self._parse_addresses = [f.address for f in self._parse_fields]
+        self._pack_field_set = set(self.pack_fields)
 
-        for f in self.fields:
-            group = ReadableRegisters(f.address, f.size)
-            self.polling_registers.append(group)
+        self.polling_registers = _merge_readable_registers(self.fields)
+        self.pack_polling_registers: List[ReadableRegisters] = []
 
         # Check if we even have battery pack fields defined
         if len(self.pack_fields) == 0 or max_packs == 0:
             return
 
-        # Optimize amount of registers to separately request
-        for f in self.pack_fields:
-            group = ReadableRegisters(f.address, f.size)
-            self.pack_polling_registers.append(group)
+        self.pack_polling_registers = _merge_readable_registers(self.pack_fields)
 
     def get_polling_registers(self) -> List[ReadableRegisters]:
         """Returns all registers required to poll device fields"""
@@ -54,6 +89,10 @@ class BluettiDevice:
         """Returns the register storing the serial number of the device"""
         raise NotImplementedError
 
+    def get_identity_registers(self) -> List[ReadableRegisters]:
+        """Returns the registers storing type and serial number of the device"""
+        raise NotImplementedError
+
     def get_iot_version(self) -> int:
         """Get the IoT protocol version of the device"""
         raise NotImplementedError
@@ -70,24 +109,24 @@ class BluettiDevice:
         # Offsets and size are counted in 2 byte chunks, so for the range we
         # need to divide the byte size by 2
         data_size = int(len(data) / 2)
+        end_address = starting_address + data_size
 
-        # Filter out fields not in range
-        r = range(starting_address, starting_address + data_size)
-        fields = [
-            f
-            for f in (self.fields + self.pack_fields)
-            if f.address in r and f.address + f.size - 1 in r
-        ]
+        # Select the fields fully contained in the response range
+        lo = bisect_left(self._parse_addresses, starting_address)
+        hi = bisect_left(self._parse_addresses, end_address)
 
-        # Parse fields
+        # Parse fields from zero-copy views into the response buffer
+        data_view = memoryview(data)
         parsed = {}
-        for f in fields:
+        for f in self._parse_fields[lo:hi]:
+            if f.address + f.size > end_address:
+                continue
             data_start = 2 * (f.address - starting_address)
-            field_data = data[data_start : data_start + 2 * f.size]
+            field_data = data_view[data_start : data_start + 2 * f.size]
             value = f.parse(field_data)
             if not f.in_range(value):
                 continue
-            if pack_num is not None and f in self.pack_fields:
+            if pack_num is not None and f in self._pack_field_set:
                 parsed[f"pack_{str(pack_num)}_{f.name}"] = value
             else:
                 parsed[f.name] = value
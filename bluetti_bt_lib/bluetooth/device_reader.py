@@ -12,11 +12,20 @@ from ..const import NOTIFY_UUID, WRITE_UUID
 from ..registers import ReadableRegisters, DeviceRegister
 from ..utils.privacy import mac_loggable
 
+RESPONSE_TIMEOUT = 5
+"""Timeout for a single command response in seconds"""
+
 
 class DeviceReaderConfig:
-    def __init__(self, timeout: int = 60, use_encryption: bool = False):
+    def __init__(
+        self,
+        timeout: int = 60,
+        use_encryption: bool = False,
+        max_connect_attempts: int = 10,
+    ):
         self.timeout = timeout
         self.use_encryption = use_encryption
+        self.max_connect_attempts = max_connect_attempts
 
 
 class DeviceReader:
@@ -92,7 +101,7 @@ class DeviceReader:
                             BleakClientWithServiceCache,
                             self.device,
                             self.device.name or "Unknown Device",
-                            max_attempts=10,
+                            max_attempts=self.config.max_connect_attempts,
                         )
 
                     self.logger.debug("Connected to device")
@@ -215,6 +224,14 @@ class DeviceReader:
                 command_bytes, self.encryption.secure_aes_key, None
             )
 
+        # Time out the response future directly instead of wrapping it in an
+        # extra task with asyncio.wait_for
+        fut = self.notify_future
+        handle = asyncio.get_running_loop().call_later(
+            RESPONSE_TIMEOUT,
+            lambda: fut.done() or fut.set_exception(TimeoutError()),
+        )
+
         try:
             # Make request
             await self.client.write_gatt_char(WRITE_UUID, command_bytes)
@@ -222,13 +239,15 @@ class DeviceReader:
             self.logger.debug("Request sent (%s)", registers)
 
             # Wait for response
-            res = await asyncio.wait_for(self.notify_future, timeout=5)
+            res = await fut
 
             self.logger.debug("Got response")
 
             return cast(bytes, res)
         except:
             self.logger.warning("Error while reading data")
+        finally:
+            handle.cancel()
 
         return bytes()
 
@@ -245,7 +264,9 @@ class DeviceReader:
         else:
             header_size = 2
 
-        padded_len = ((data_len + AES_BLOCK_SIZE - 1) // AES_BLOCK_SIZE) * AES_BLOCK_SIZE
+        padded_len = (
+            (data_len + AES_BLOCK_SIZE - 1) // AES_BLOCK_SIZE
+        ) * AES_BLOCK_SIZE
 
         return header_size + padded_len
 
@@ -278,7 +299,9 @@ class DeviceReader:
 
             self.encrypted_buffer.extend(data)
 
-            expected_len = self._calculate_expected_encrypted_length(self.encrypted_buffer)
+            expected_len = self._calculate_expected_encrypted_length(
+                self.encrypted_buffer
+            )
 
             if expected_len is None:
                 return
@@ -287,7 +310,7 @@ class DeviceReader:
                 self.logger.debug(
                     "Buffering fragment: %d/%d bytes",
                     len(self.encrypted_buffer),
-                    expected_len
+                    expected_len,
                 )
                 return
 
@@ -301,7 +324,9 @@ class DeviceReader:
             key, iv = self.encryption.getKeyIv()
 
             try:
-                decrypted = Message(self.encryption.aes_decrypt(complete_message, key, iv))
+                decrypted = Message(
+                    self.encryption.aes_decrypt(complete_message, key, iv)
+                )
             except ValueError as e:
                 self.logger.error("Decryption failed: %s", e)
                 self.encrypted_buffer.clear()
@@ -325,7 +350,17 @@ class DeviceReader:
         # Save data
         self.notify_response.extend(data)
 
-        if self.notify_future is None:
+        if self.notify_future is None or self.notify_future.done():
             return
 
+        # Merged reads can exceed the MTU and arrive in several
+        # notifications, so wait until the expected byte count is reached.
+        # Exception frames are short and complete on their own.
+        if (
+            self.current_registers is not None
+            and len(self.notify_response) < self.current_registers.response_size()
+        ):
+            if not self.current_registers.is_exception_response(self.notify_response):
+                return
+
         self.notify_future.set_result(self.notify_response)
@@ -1,116 +1,218 @@
 import asyncio
 import logging
-from typing import Any, Callable, List
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
 
 from ..base_devices import BluettiDevice, BaseDeviceV1, BaseDeviceV2
 from ..bluetooth import DeviceReader, DeviceReaderConfig
 from ..devices import DEVICE_NAME_RE
+from ..registers import ReadableRegisters
 from ..fields import FieldName
 
 _LOGGER = logging.getLogger(__name__)
 
+# Since we don't know the type we use the base devices for probing. Their
+# field lists never change, so build them once at import time instead of on
+# every recognition attempt
+_PROBE_DEVICES: List[BluettiDevice] = [
+    BaseDeviceV2(),
+    BaseDeviceV1(),
+]
 
+# Reader configs are immutable for our purposes, so share them as well.
+# The plaintext probe goes first: it has the shorter timeout and most
+# devices answer it, so the expensive encryption handshake is only
+# attempted when the cheap probe fails
+_PROBE_CONFIGS: List[DeviceReaderConfig] = [
+    DeviceReaderConfig(timeout=8),
+    DeviceReaderConfig(
+        timeout=15,
+        use_encryption=True,
+    ),
+]
+
+
+# Successful recognitions keyed by mac, so reconnects to a known device
+# skip the multi-second probe sequence
+_RESULT_CACHE_TTL = 3600
+_result_cache: Dict[str, Tuple[float, "DeviceRecognizerResult"]] = {}
+
+
+def clear_recognition_cache():
+    """Forget all cached recognition results"""
+    _result_cache.clear()
+
+
+@dataclass(slots=True)
 class DeviceRecognizerResult:
-    def __init__(
-        self, name: str, iot_version: int, encrypted: bool, sn: int | None = None
-    ):
-        self.name = name
-        self.iot_version = iot_version
-        self.encrypted = encrypted
-        self.sn = sn
-        self.full_name = name + str(sn)
+    name: str
+    iot_version: int
+    encrypted: bool
+    sn: int | None = None
+    full_name: str = field(init=False)
 
+    warmup_future: "asyncio.Task | None" = field(init=False, default=None)
+    """Set when recognize_device was given warmup registers to prefetch"""
 
-async def recognize_device(
+    def __post_init__(self):
+        self.full_name = self.name + str(self.sn)
+
+
+async def _probe(
     mac: str,
+    bluetti_device: BluettiDevice,
+    config: DeviceReaderConfig,
     future_builder_method: Callable[[], asyncio.Future[Any]],
+    lock: asyncio.Lock,
+    warmup_registers: Callable[[BluettiDevice], List[ReadableRegisters]] | None = None,
 ) -> DeviceRecognizerResult | None:
-    # Since we don't know the type we use the base device
-    bluetti_devices: List[BluettiDevice] = [
-        BaseDeviceV2(),
-        BaseDeviceV1(),
-    ]
+    """Probe the device with a single base device / reader config combination"""
 
-    for bluetti_device in bluetti_devices:
-        # Create device builder
-        device_readers = [
-            DeviceReader(
-                mac,
-                bluetti_device,
-                future_builder_method,
-                DeviceReaderConfig(
-                    timeout=15,
-                    use_encryption=True,
-                ),
-            ),
-            DeviceReader(
-                mac,
-                bluetti_device,
-                future_builder_method,
-                DeviceReaderConfig(timeout=8),
-            ),
-        ]
+    device_reader = DeviceReader(
+        mac,
+        bluetti_device,
+        future_builder_method,
+        config,
+        lock=lock,
+    )
 
-        for device_reader in device_readers:
+    # Type and serial number live close together, so one request covers both
+    data = await device_reader.read(
+        bluetti_device.get_identity_registers(),
+    )
 
-            # We only need 6 registers to get the device type
-            data = await device_reader.read(
-                bluetti_device.get_device_type_registers(),
-            )
+    if data is None:
+        return None
+
+    type_data = data.get(FieldName.DEVICE_TYPE.value)
+
+    if type_data is None:
+        # We have a problem
+        _LOGGER.error("No data in device type type_data")
+        return None
 
-            if data is None:
-                continue
+    if not isinstance(type_data, str):
+        # We have a problem
+        _LOGGER.error("Invalid data in device type type_data")
+        return None
 
-            type_data = data.get(FieldName.DEVICE_TYPE.value)
+    if type_data == "":
+        # Empty string is not a valid device type
+        return None
 
-            if type_data is None:
-                # We have a problem
-                _LOGGER.error("No data in device type type_data")
-                continue
+    if DEVICE_NAME_RE.match(type_data + "12345678") is None:
+        # Some V2 Devices populate the V1 register for type, so we need to check here
+        _LOGGER.warning("Device has populated type_data with trash data")
+        return None
 
-            if not isinstance(type_data, str):
-                # We have a problem
-                _LOGGER.error("Invalid data in device type type_data")
-                continue
+    sn_data = data.get(FieldName.DEVICE_SN.value)
 
-            if type_data == "":
-                # Empty string is not a valid device type
-                continue
+    if not isinstance(sn_data, int) or sn_data == "":
+        # Should never happen
+        sn_data = "000000000000"  # Use dummy SN
 
-            if DEVICE_NAME_RE.match(type_data + "12345678") is None:
-                # Some V2 Devices populate the V1 register for type, so we need to check here
-                _LOGGER.warning("Device has populated type_data with trash data")
-                continue
+    result = DeviceRecognizerResult(
+        type_data,
+        bluetti_device.get_iot_version(),
+        device_reader.config.use_encryption,
+        sn_data,
+    )
 
-            data = await device_reader.read(
-                bluetti_device.get_device_sn_registers(),
+    if warmup_registers is not None:
+        # Prefetch the first poll on the same reader so the caller can await
+        # it instead of paying a cold read after recognition
+        result.warmup_future = asyncio.create_task(
+            device_reader.read(warmup_registers(bluetti_device))
+        )
+
+    return result
+
+
+async def recognize_device(
+    mac: str,
+    future_builder_method: Callable[[], asyncio.Future[Any]],
+    warmup_registers: Callable[[BluettiDevice], List[ReadableRegisters]] | None = None,
+) -> DeviceRecognizerResult | None:
+    cached = _result_cache.get(mac)
+    if cached is not None and time.monotonic() - cached[0] < _RESULT_CACHE_TTL:
+        # Hand out a copy so the per-caller warmup task never ends up in
+        # the cache
+        result = DeviceRecognizerResult(
+            cached[1].name,
+            cached[1].iot_version,
+            cached[1].encrypted,
+            cached[1].sn,
+        )
+
+        if warmup_registers is not None:
+            # The probe's warmup task belonged to the original caller, so
+            # start a fresh prefetch for this one
+            bluetti_device = next(
+                d for d in _PROBE_DEVICES if d.get_iot_version() == result.iot_version
+            )
+            config = _PROBE_CONFIGS[1] if result.encrypted else _PROBE_CONFIGS[0]
+            # A fresh lock, so warmups for different macs don't serialize
+            # on DeviceReader's shared default lock
+            device_reader = DeviceReader(
+                mac,
+                bluetti_device,
+                future_builder_method,
+                config,
+                lock=asyncio.Lock(),
+            )
+            result.warmup_future = asyncio.create_task(
+                device_reader.read(warmup_registers(bluetti_device))
             )
 
-            if data is None:
-                # Should never happen
-                return DeviceRecognizerResult(
-                    type_data,
-                    bluetti_device.get_iot_version(),
-                    device_reader.config.use_encryption,
-                    "000000000000",  # Use dummy SN
-                )
-
-            sn_data = data.get(FieldName.DEVICE_SN.value)
-
-            if not isinstance(sn_data, int) or sn_data == "":
-                # Should never happen
-                return DeviceRecognizerResult(
-                    type_data,
-                    bluetti_device.get_iot_version(),
-                    device_reader.config.use_encryption,
-                    "000000000000",  # Use dummy SN
-                )
-
-            return DeviceRecognizerResult(
-                type_data,
-                bluetti_device.get_iot_version(),
-                device_reader.config.use_encryption,
-                sn_data,
+        return result
+
+    # The probes share one lock so only one of them talks to the device at a
+    # time, but their waits overlap and the first successful probe cancels the
+    # remaining ones
+    lock = asyncio.Lock()
+
+    tasks = [
+        asyncio.create_task(
+            _probe(
+                mac,
+                bluetti_device,
+                config,
+                future_builder_method,
+                lock,
+                warmup_registers,
             )
+        )
+        # Config-major order so both plaintext probes queue for the lock
+        # before either encrypted one pays the handshake wait
+        for config in _PROBE_CONFIGS
+        for bluetti_device in _PROBE_DEVICES
+    ]
+
+    result: DeviceRecognizerResult | None = None
+
+    try:
+        for next_probe in asyncio.as_completed(tasks):
+            result = await next_probe
+
+            if result is not None:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    if result is not None:
+        # Cache without the warmup task: it is consumed by this caller and
+        # its data would be stale for later cache hits
+        _result_cache[mac] = (
+            time.monotonic(),
+            DeviceRecognizerResult(
+                result.name,
+                result.iot_version,
+                result.encrypted,
+                result.sn,
+            ),
+        )
 
-    return None
+    return result
@@ -2,15 +2,16 @@ import struct
 
 from . import DeviceField, FieldName
 
+_U16 = struct.Struct("!H")
+
+# Single lookup instead of a membership test plus bool() call; values
+# other than 0/1 fall through to None as before
+_BOOL_MAP = {0: False, 1: True}
+
 
 class BoolField(DeviceField):
     def __init__(self, name: FieldName, address: int):
         super().__init__(name, address, 1)
 
     def parse(self, data: bytes) -> bool | None:
-        num = struct.unpack("!H", data)[0]
-
-        if num not in [0, 1]:
-            return None
-
-        return bool(num)
+        return _BOOL_MAP.get(_U16.unpack(data)[0])
@@ -2,6 +2,8 @@ import struct
 
 from . import DeviceField, FieldName
 
+_U16 = struct.Struct("!H")
+
 
 class BoolFieldNonZero(DeviceField):
     """Bool field where only value 1 means True.
@@ -19,5 +21,5 @@ class BoolFieldNonZero(DeviceField):
         super().__init__(name, address, 1)
 
     def parse(self, data: bytes) -> bool:
-        num = struct.unpack("!H", data)[0]
+        num = _U16.unpack(data)[0]
         return num == 1
@@ -8,7 +8,9 @@ class DecimalArrayField(DeviceField):
     def __init__(self, name: str, address: int, size: int, scale: int):
         self.scale = scale
         super().__init__(name, address, size)
+        # The element count is fixed per field, so compile the format once
+        self._struct = struct.Struct(f"!{size}H")
 
     def parse(self, data: bytes) -> Decimal:
-        values = list(struct.unpack(f"!{self.size}H", data))
-        return [Decimal(v) / 10 ** self.scale for v in values]
+        values = self._struct.unpack(data)
+        return [Decimal(v) / 10**self.scale for v in values]
@@ -3,6 +3,8 @@ from decimal import Decimal
 
 from . import DeviceField, FieldName
 
+_U16 = struct.Struct("!H")
+
 
 class DecimalField(DeviceField):
     def __init__(
@@ -20,9 +22,19 @@ class DecimalField(DeviceField):
         self.min = min
         self.max = max
 
-    def parse(self, data: bytes) -> Decimal:
-        val = Decimal(struct.unpack("!H", data)[0])
-        return (val / 10 ** self.scale) * Decimal(self.multiplier)
+        # Most fields have no multiplier; shifting the exponent with
+        # scaleb skips the Decimal division entirely
+        if multiplier == 1:
+            self.parse = self._parse_scaled
+        else:
+            self.parse = self._parse_multiplied
+
+    def _parse_scaled(self, data: bytes) -> Decimal:
+        return Decimal(_U16.unpack(data)[0]).scaleb(-self.scale)
+
+    def _parse_multiplied(self, data: bytes) -> Decimal:
+        val = Decimal(_U16.unpack(data)[0])
+        return (val / 10**self.scale) * Decimal(self.multiplier)
 
     def in_range(self, value: Decimal) -> bool:
         if self.min is not None and self.min > value:
@@ -4,6 +4,7 @@ from typing import Type, TypeVar
 
 from . import DeviceField, FieldName
 
+_U16 = struct.Struct("!H")
 
 E = TypeVar("E", bound=Enum)
 
@@ -13,10 +14,9 @@ class EnumField(DeviceField):
         super().__init__(name, address, 1)
         self.e = e
 
-    def parse(self, data: bytes) -> E | None:
-        val = struct.unpack("!H", data)[0]
-
-        if val not in [e.value for e in self.e]:
-            return None
+        # Plain dict lookup instead of scanning the members on every parse
+        self._members = {member.value: member for member in e}
 
-        return self.e(val)
+    def parse(self, data: bytes) -> E | None:
+        val = _U16.unpack(data)[0]
+        return self._members.get(val)
@@ -2,7 +2,9 @@ from enum import Enum, unique
 
 
 @unique
-class FieldName(Enum):
+class FieldName(str, Enum):
+    """Field names usable directly as their string value (e.g. as dict keys)"""
+
     AC_INPUT_CURRENT = "ac_input_current"
     AC_INPUT_FREQUENCY = "ac_input_frequency"
     AC_INPUT_POWER = "ac_input_power"
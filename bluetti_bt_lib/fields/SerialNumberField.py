@@ -2,6 +2,8 @@ import struct
 
 from . import DeviceField, FieldName
 
+_SN = struct.Struct("!4H")
+
 
 class SerialNumberField(DeviceField):
     def __init__(self, name: FieldName, address: int):
@@ -11,5 +13,5 @@ class SerialNumberField(DeviceField):
         if len(data) != 8:
             return None
 
-        values = struct.unpack("!4H", data)
+        values = _SN.unpack(data)
         return values[0] + (values[1] << 16) + (values[2] << 32) + (values[3] << 48)
@@ -6,4 +6,5 @@ class StringField(DeviceField):
         super().__init__(name, address, size)
 
     def parse(self, data: bytes) -> str:
-        return data.rstrip(b"\0").decode("ascii", errors="ignore")
+        # bytes() also accepts memoryview slices and is free for bytes input
+        return bytes(data).rstrip(b"\0").decode("ascii", errors="ignore")
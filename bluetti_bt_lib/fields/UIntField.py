@@ -2,6 +2,8 @@ import struct
 
 from . import DeviceField, FieldName
 
+_U16 = struct.Struct("!H")
+
 
 class UIntField(DeviceField):
     def __init__(
@@ -17,11 +19,18 @@ class UIntField(DeviceField):
         self.min = min
         self.max = max
 
-    def parse(self, data: bytes) -> int:
-        val = struct.unpack("!H", data)[0]
-        if self.multiplier != 1:
-            val = round(val * self.multiplier, 2)
-        return val
+        # The multiplier is known here, so pick the parse variant once
+        # instead of branching (and rounding) on every call
+        if multiplier == 1:
+            self.parse = self._parse_plain
+        else:
+            self.parse = self._parse_scaled
+
+    def _parse_plain(self, data: bytes) -> int:
+        return _U16.unpack(data)[0]
+
+    def _parse_scaled(self, data: bytes) -> int:
+        return round(_U16.unpack(data)[0] * self.multiplier, 2)
 
     def in_range(self, value: int) -> bool:
         if self.min is not None and self.min > value:
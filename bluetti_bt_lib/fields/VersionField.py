@@ -3,6 +3,8 @@ from decimal import Decimal
 
 from . import DeviceField, FieldName
 
+_VERSION = struct.Struct("!2H")
+
 
 class VersionField(DeviceField):
     def __init__(self, name: FieldName, address: int):
@@ -12,5 +14,5 @@ class VersionField(DeviceField):
         if len(data) != 4:
             return None
 
-        values = struct.unpack("!2H", data)
+        values = _VERSION.unpack(data)
         return Decimal(values[0] + (values[1] << 16)) / 100
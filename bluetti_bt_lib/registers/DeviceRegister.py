@@ -1,10 +1,23 @@
 import struct
+from functools import lru_cache
+
 import crcmod.predefined
 from enum import Enum
 
 modbus_crc = crcmod.predefined.mkCrcFun("modbus")
 
 
+@lru_cache(maxsize=1024)
+def _build_command(action_value: int, data: bytes) -> bytes:
+    """Build a command frame including its CRC"""
+    cmd = bytearray(len(data) + 4)
+    cmd[0] = 1
+    cmd[1] = action_value
+    cmd[2:-2] = data
+    struct.pack_into("<H", cmd, -2, modbus_crc(cmd[:-2]))
+    return bytes(cmd)
+
+
 class RegisterAction(Enum):
     READ = 3
     WRITE = 6
@@ -14,11 +27,9 @@ class DeviceRegister:
     def __init__(self, register_action: RegisterAction, data: bytes):
         self.register_action = register_action
 
-        self.cmd = bytearray(len(data) + 4)
-        self.cmd[0] = 1
-        self.cmd[1] = register_action.value
-        self.cmd[2:-2] = data
-        struct.pack_into("<H", self.cmd, -2, modbus_crc(self.cmd[:-2]))
+        # Identical registers are built for every device instance, so the
+        # assembled frames are shared through the cache
+        self.cmd = _build_command(register_action.value, data)
 
     def response_size(self) -> int:
         """Returns the expected response size in bytes"""
@@ -28,6 +39,10 @@ class DeviceRegister:
         """Provide an iter implemention so that bytes(cmd) works"""
         return iter(self.cmd)
 
+    def __bytes__(self):
+        """Return the prebuilt frame so that bytes(cmd) doesn't copy"""
+        return self.cmd
+
     def is_exception_response(self, response: bytes):
         """Checks the response code to see if it's a MODBUS exception"""
         if len(response) < 2:
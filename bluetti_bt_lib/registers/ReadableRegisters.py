@@ -18,7 +18,8 @@ class ReadableRegisters(DeviceRegister):
         return 2 * self.quantity + 5
 
     def parse_response(self, response: bytes):
-        return bytes(response[3:-2])
+        # Slice through a view so the body is copied only once
+        return bytes(memoryview(response)[3:-2])
 
     def __repr__(self):
         return f"ReadableRegisters(starting_address={self.starting_address}, quantity={self.quantity})"
@@ -13,7 +13,7 @@ class WriteableRegister(DeviceRegister):
         return 8
 
     def parse_response(self, response: bytes):
-        return bytes(response[4:6])
+        return bytes(memoryview(response)[4:6])
 
     def __repr__(self):
         return f"WriteableRegister(address={self.address}, value={self.value:#04x})"
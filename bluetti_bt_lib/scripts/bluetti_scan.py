@@ -8,38 +8,68 @@ from typing import List
 from bleak import BleakScanner
 from bleak.backends.device import BLEDevice
 
+from ..const import SERVICE_UUID
 from ..utils.device_info import get_type_by_bt_name
 
 
-async def scan_async(custom_regex, scan_time):
-    # maybe there is some other trigger we would want to stop scan on?
+async def scan_async(custom_regex, scan_time, first_match=False):
+    # Set to prematurely stop the scan, e.g. once the first device was found
     stop_event = asyncio.Event()
-    # We can set the above event to prematurely stop the scan e.g. with `stop_event.set()`
 
-    found: List[List[str]] = []
+    found: List[str] = []
+    seen: set[str] = set()
+
+    # Compile once instead of on every received advertisement
+    pattern = re.compile(custom_regex) if custom_regex else None
 
     print(f"Scanning for {scan_time} seconds (or until Ctrl+C)...")
 
+    # Printing does blocking stdio writes, so keep it off the scanner
+    # callback and drain the results from a separate task instead
+    output_queue: asyncio.Queue = asyncio.Queue()
+
+    async def drain_output():
+        while True:
+            print(await output_queue.get())
+
     async def callback(device: BLEDevice, _):
         if device.name is None:
             return
 
-        if custom_regex:
-            match = re.match(custom_regex, device.name)
+        if pattern is not None:
+            match = pattern.match(device.name)
             result = None if match is None else match[0]
         else:
             result = get_type_by_bt_name(device.name)
 
         if result is not None or device.name.startswith("PBOX"):
-            if not any(device.address in devices for devices in found):
+            if device.address not in seen:
+                seen.add(device.address)
                 found.append(device.address)
-                print([result, device.address])
+                output_queue.put_nowait([result, device.address])
+
+                if first_match:
+                    stop_event.set()
 
-    async with BleakScanner(callback):
+    # With the default name matching we can let the backend drop foreign
+    # advertisements by service UUID; a custom regex may target devices
+    # which don't advertise the Bluetti service, so skip the filter there
+    service_uuids = None if pattern is not None else [SERVICE_UUID]
+
+    drainer = asyncio.create_task(drain_output())
+
+    async with BleakScanner(
+        callback, service_uuids=service_uuids, scanning_mode="active"
+    ):
         try:
             await asyncio.wait_for(stop_event.wait(), scan_time)
         except (asyncio.exceptions.CancelledError, asyncio.TimeoutError):
-            exit()
+            pass
+        finally:
+            drainer.cancel()
+            # Flush anything the drainer didn't get to
+            while not output_queue.empty():
+                print(output_queue.get_nowait())
 
 
 def start():
@@ -57,11 +87,17 @@ def start():
         default=5,
         help="How long to scan for devices (seconds)",
     )
+    parser.add_argument(
+        "-f",
+        "--first",
+        action="store_true",
+        help="Stop scanning after the first matching device",
+    )
     args = parser.parse_args()
 
     logging.basicConfig(level=logging.WARNING)
 
-    asyncio.run(scan_async(args.regex, args.scan_time))
+    asyncio.run(scan_async(args.regex, args.scan_time, args.first))
 
 
 if __name__ == "__main__":
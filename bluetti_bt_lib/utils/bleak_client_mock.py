@@ -1,19 +1,38 @@
 """Bleak Mock Client for unittests."""
 
 from decimal import Decimal
+from functools import lru_cache
 import struct
 import sys
 from typing import Awaitable, Callable, List, Union
 import uuid
 from bleak.backends.characteristic import BleakGATTCharacteristic
-import crcmod
+
+from ..registers import modbus_crc
 
 if sys.version_info < (3, 12):
     from typing_extensions import Buffer
 else:
     from collections.abc import Buffer
 
-modbus_crc = crcmod.predefined.mkCrcFun("modbus")
+# Prebuilt structs so the fixed formats aren't re-resolved per call
+_U16 = struct.Struct("!H")
+_SN = struct.Struct("!4H")
+_CMD_HDR = struct.Struct("!HHHH")
+_CRC = struct.Struct("<H")
+
+# Polling tests request the same registers over and over, so remember the
+# CRC per response frame instead of recomputing it
+_cached_crc = lru_cache(maxsize=1024)(modbus_crc)
+
+_ILLEGAL_FUNCTION = 1
+
+
+@lru_cache(maxsize=128)
+def _exception_response(device_addr: int, function_code: int, exception_code: int):
+    """Build a MODBUS exception frame; the few distinct frames are cached"""
+    body = bytes((device_addr, function_code | 0x80, exception_code))
+    return body + _CRC.pack(modbus_crc(body))
 
 
 def swap_bytes(data: bytes):
@@ -25,7 +44,7 @@ def swap_bytes(data: bytes):
 
 
 def r_int(value: int):
-    return struct.pack("!H", value)
+    return _U16.pack(value)
 
 
 def r_str(value: str, max_size: int):
@@ -41,7 +60,7 @@ def r_sn(value: int):
     part3 = (value >> 16) & 0xFFFF
     part2 = (value >> 32) & 0xFFFF
     part1 = (value >> 48) & 0xFFFF
-    return struct.pack("!4H", part4, part3, part2, part1)
+    return _SN.pack(part4, part3, part2, part1)
 
 
 class BleakClientMock:
@@ -51,10 +70,31 @@ class BleakClientMock:
         self._bytemap: bytearray = bytearray(40000)
         self.packs: List[bytearray] = [bytearray() for _ in range(packs_max)]
 
+        # Dispatch by MODBUS function code instead of branching per command
+        self._handlers = {
+            3: self._get_register,
+            6: self._set_register,
+        }
+
+        # Scratch buffer reused for every response frame
+        self._resp_buf = bytearray(512)
+
+    def _response_frame(self, size: int) -> memoryview:
+        """Return a writable view of the given size into the scratch buffer"""
+        if size > len(self._resp_buf):
+            self._resp_buf = bytearray(size)
+        return memoryview(self._resp_buf)[:size]
+
     def add_r_int(self, register: int, value: int):
         real = register * 2
         self._bytemap[real : real + 2] = r_int(value)
 
+    def add_r_ints(self, register: int, values: List[int]):
+        """Set consecutive registers with a single pack and write"""
+        real = register * 2
+        data = struct.pack(f"!{len(values)}H", *values)
+        self._bytemap[real : real + len(data)] = data
+
     def add_r_str(self, register: int, value: str, max_size: int):
         real = register * 2
         self._bytemap[real : real + max_size * 2] = r_str(value, max_size)
@@ -70,6 +110,14 @@ class BleakClientMock:
     def add_pack(self, n: int, b: bytearray):
         self.packs[n] = b
 
+    def snapshot(self) -> bytes:
+        """Returns an immutable copy of the current register image"""
+        return bytes(self._bytemap)
+
+    def restore(self, snap: bytes):
+        """Replaces the register image with a previously taken snapshot"""
+        self._bytemap[:] = snap
+
     async def start_notify(
         self,
         char_specifier: Union[BleakGATTCharacteristic, int, str, uuid.UUID],
@@ -95,18 +143,41 @@ class BleakClientMock:
         data: Buffer,
         response: bool = None,
     ) -> None:
-        cmd = struct.unpack_from("!HHHH", data)
-        content = await self._get_register(cmd[1], cmd[2])
+        cmd = _CMD_HDR.unpack_from(data)
+
+        handler = self._handlers.get(cmd[0] & 0xFF)
+        if handler is None:
+            await self._callback(
+                char_specifier,
+                _exception_response(cmd[0] >> 8, cmd[0] & 0xFF, _ILLEGAL_FUNCTION),
+            )
+            return
+
+        content = await handler(cmd[1], cmd[2])
         await self._callback(char_specifier, content)
 
     async def _get_register(self, addr: int, size: int):
-        data = self._bytemap[(addr * 2) : (addr * 2 + size * 2)]
-        response = bytearray(len(data) + 4)
+        # A view avoids copying the register data twice
+        data = memoryview(self._bytemap)[(addr * 2) : (addr * 2 + size * 2)]
+        # 3 byte header + data + 2 byte crc
+        response = self._response_frame(len(data) + 5)
         response[0] = 0
         response[1] = 0
         response[2] = 0
         response[3:-2] = data
-        struct.pack_into("<H", response, -2, modbus_crc(response[:-2]))
+        _CRC.pack_into(response, -2, _cached_crc(bytes(response[:-2])))
+        return response
+
+    async def _set_register(self, addr: int, value: int):
+        self.add_r_int(addr, value)
+
+        # Write responses echo address and value
+        response = self._response_frame(8)
+        response[0] = 1
+        response[1] = 6
+        _U16.pack_into(response, 2, addr)
+        _U16.pack_into(response, 4, value)
+        _CRC.pack_into(response, -2, _cached_crc(bytes(response[:-2])))
         return response
 
 
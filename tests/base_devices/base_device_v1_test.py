@@ -19,14 +19,8 @@ class TestV1(unittest.IsolatedAsyncioTestCase):
         self.ble_mock.add_r_sn(17, 1000000000000)
         # SOC
         self.ble_mock.add_r_int(43, 1)
-        # DC Input Power
-        self.ble_mock.add_r_int(36, 500)
-        # AC Input Power
-        self.ble_mock.add_r_int(37, 600)
-        # AC Output Power
-        self.ble_mock.add_r_int(38, 2500)
-        # DC Output Power
-        self.ble_mock.add_r_int(39, 24)
+        # DC Input / AC Input / AC Output / DC Output Power
+        self.ble_mock.add_r_ints(36, [500, 600, 2500, 24])
 
     async def test_v1(self):
         device = BaseDeviceV1()
@@ -50,6 +50,9 @@ class TestBluettiDevice(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             device.get_device_sn_registers()
 
+        with self.assertRaises(NotImplementedError):
+            device.get_identity_registers()
+
         with self.assertRaises(NotImplementedError):
             device.get_iot_version()
 
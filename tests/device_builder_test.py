@@ -5,7 +5,9 @@ from bluetti_bt_lib.devices import DEVICES
 
 
 class TestDeviceBuilder(unittest.TestCase):
+    # Building every device is the expensive part, so do it once for the class
+    built_devices = {name: build_device(name + "12345678") for name in DEVICES}
+
     def test_build(self):
         for name, cls in DEVICES.items():
-            built = build_device(name + "12345678")
-            self.assertIsInstance(built, cls)
+            self.assertIsInstance(self.built_devices[name], cls)
@@ -8,24 +8,26 @@ from bluetti_bt_lib.utils.bleak_client_mock import ClientMockNoEncryption
 
 
 class TestDeviceReader(unittest.IsolatedAsyncioTestCase):
-    def __init__(self, methodName="runTest"):
-        super().__init__(methodName)
-        self.ble_mock = ClientMockNoEncryption()
+    @classmethod
+    def setUpClass(cls):
+        # Build the register image once and restore it per test so each
+        # test still gets a pristine mock
+        ble_mock = ClientMockNoEncryption()
 
         # Device type
-        self.ble_mock.add_r_str(10, "AC300", 6)
+        ble_mock.add_r_str(10, "AC300", 6)
         # Serial
-        self.ble_mock.add_r_sn(17, 2300000000000)
-        # DC input power
-        self.ble_mock.add_r_int(36, 10)
-        # AC input power
-        self.ble_mock.add_r_int(37, 8)
-        # AC output power
-        self.ble_mock.add_r_int(38, 9)
-        # AC output power
-        self.ble_mock.add_r_int(39, 7)
+        ble_mock.add_r_sn(17, 2300000000000)
+        # DC input / AC input / AC output / DC output power
+        ble_mock.add_r_ints(36, [10, 8, 9, 7])
         # SOC
-        self.ble_mock.add_r_int(43, 78)
+        ble_mock.add_r_int(43, 78)
+
+        cls._proto_snapshot = ble_mock.snapshot()
+
+    async def asyncSetUp(self):
+        self.ble_mock = ClientMockNoEncryption()
+        self.ble_mock.restore(self._proto_snapshot)
 
     async def test_read_all_correct(self):
         device = BaseDeviceV1()
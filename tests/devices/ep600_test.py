@@ -6,123 +6,130 @@ from bluetti_bt_lib.utils.bleak_client_mock import ClientMockNoEncryption
 from bluetti_bt_lib.devices import EP600
 from bluetti_bt_lib import DeviceReader, FieldName
 
+# Expected parse result for the prototype register image; comparing the whole
+# dict at once yields a single structural diff on failure
+EXPECTED_DATA = {
+    FieldName.POWER_GENERATION.value: Decimal("350.5"),
+    FieldName.PV_S1_POWER.value: 1200,
+    FieldName.PV_S1_VOLTAGE.value: Decimal("45.0"),
+    FieldName.PV_S1_CURRENT.value: Decimal("26.6"),
+    FieldName.PV_S2_POWER.value: 2300,
+    FieldName.PV_S2_VOLTAGE.value: Decimal("48.0"),
+    FieldName.PV_S2_CURRENT.value: Decimal("47.9"),
+    FieldName.SM_P1_POWER.value: 0,
+    FieldName.SM_P1_VOLTAGE.value: 0,
+    FieldName.SM_P1_CURRENT.value: 0,
+    FieldName.SM_P2_POWER.value: 0,
+    FieldName.SM_P2_VOLTAGE.value: 0,
+    FieldName.SM_P2_CURRENT.value: 0,
+    FieldName.SM_P3_POWER.value: 0,
+    FieldName.SM_P3_VOLTAGE.value: 0,
+    FieldName.SM_P3_CURRENT.value: 0,
+    FieldName.GRID_FREQUENCY.value: Decimal("50.0"),
+    FieldName.GRID_P1_POWER.value: 0,
+    FieldName.GRID_P1_VOLTAGE.value: 0,
+    FieldName.GRID_P1_CURRENT.value: 0,
+    FieldName.GRID_P2_POWER.value: 0,
+    FieldName.GRID_P2_VOLTAGE.value: 0,
+    FieldName.GRID_P2_CURRENT.value: 0,
+    FieldName.GRID_P3_POWER.value: 0,
+    FieldName.GRID_P3_VOLTAGE.value: 0,
+    FieldName.GRID_P3_CURRENT.value: 0,
+    FieldName.AC_OUTPUT_FREQUENCY.value: Decimal("50.0"),
+    FieldName.AC_P1_POWER.value: 5,
+    FieldName.AC_P1_VOLTAGE.value: 0,
+    FieldName.AC_P1_CURRENT.value: 0,
+    FieldName.AC_P2_POWER.value: 77,
+    FieldName.AC_P2_VOLTAGE.value: 0,
+    FieldName.AC_P2_CURRENT.value: 0,
+    FieldName.AC_P3_POWER.value: 9,
+    FieldName.AC_P3_VOLTAGE.value: 0,
+    FieldName.AC_P3_CURRENT.value: 0,
+    FieldName.CTRL_AC.value: True,
+    FieldName.BATTERY_SOC_RANGE_START.value: 20,
+    FieldName.BATTERY_SOC_RANGE_END.value: 80,
+    FieldName.CTRL_GENERATOR.value: False,
+    FieldName.GRID_VOLT_MIN_VAL.value: Decimal("20.0"),
+    FieldName.GRID_VOLT_MAX_VAL.value: Decimal("24.5"),
+    FieldName.GRID_FREQ_MIN_VALUE.value: Decimal("48"),
+    FieldName.GRID_FREQ_MAX_VALUE.value: Decimal("52"),
+    FieldName.WIFI_NAME.value: "MyHomeSSID",
+}
+
 
 class TestEP600(unittest.IsolatedAsyncioTestCase):
-    async def asyncSetUp(self):
-        self._createMock()
+    @classmethod
+    def setUpClass(cls):
+        # Filling the ~50 registers is the expensive part of the setup, so
+        # build the register image once and restore it per test
+        cls._proto_snapshot = cls._createMock().snapshot()
 
-    def _createMock(self):
+    async def asyncSetUp(self):
         self.ble_mock = ClientMockNoEncryption()
+        self.ble_mock.restore(self._proto_snapshot)
+
+    @staticmethod
+    def _createMock():
+        ble_mock = ClientMockNoEncryption()
 
         # Power generation
-        self.ble_mock.add_r_int(1202, 3505)
-
-        # PV S1 Power
-        self.ble_mock.add_r_int(1212, 1200)
-        # PV S1 Voltage
-        self.ble_mock.add_r_int(1213, 450)
-        # PV S1 Current
-        self.ble_mock.add_r_int(1214, 266)
-
-        # PV S2 Power
-        self.ble_mock.add_r_int(1220, 2300)
-        # PV S2 Voltage
-        self.ble_mock.add_r_int(1221, 480)
-        # PV S2 Current
-        self.ble_mock.add_r_int(1222, 479)
-
-        # SM P1 Power
-        self.ble_mock.add_r_int(1228, 0)
-        # SM P1 Voltage
-        self.ble_mock.add_r_int(1229, 0)
-        # SM P1 Current
-        self.ble_mock.add_r_int(1230, 0)
-
-        # SM P2 Power
-        self.ble_mock.add_r_int(1236, 0)
-        # SM P2 Voltage
-        self.ble_mock.add_r_int(1237, 0)
-        # SM P2 Current
-        self.ble_mock.add_r_int(1238, 0)
-
-        # SM P3 Power
-        self.ble_mock.add_r_int(1244, 0)
-        # SM P3 Voltage
-        self.ble_mock.add_r_int(1245, 0)
-        # SM P3 Current
-        self.ble_mock.add_r_int(1246, 0)
+        ble_mock.add_r_int(1202, 3505)
+
+        # PV S1 Power / Voltage / Current
+        ble_mock.add_r_ints(1212, [1200, 450, 266])
+
+        # PV S2 Power / Voltage / Current
+        ble_mock.add_r_ints(1220, [2300, 480, 479])
+
+        # SM P1 Power / Voltage / Current
+        ble_mock.add_r_ints(1228, [0, 0, 0])
+
+        # SM P2 Power / Voltage / Current
+        ble_mock.add_r_ints(1236, [0, 0, 0])
+
+        # SM P3 Power / Voltage / Current
+        ble_mock.add_r_ints(1244, [0, 0, 0])
 
         # Grid Frequency
-        self.ble_mock.add_r_int(1300, 500)
-
-        # Grid P1 Power
-        self.ble_mock.add_r_int(1313, 0)
-        # Grid P1 Voltage
-        self.ble_mock.add_r_int(1314, 0)
-        # Grid P1 Current
-        self.ble_mock.add_r_int(1315, 0)
-
-        # Grid P2 Power
-        self.ble_mock.add_r_int(1319, 0)
-        # Grid P2 Voltage
-        self.ble_mock.add_r_int(1320, 0)
-        # Grid P2 Current
-        self.ble_mock.add_r_int(1321, 0)
-
-        # Grid P3 Power
-        self.ble_mock.add_r_int(1325, 0)
-        # Grid P3 Voltage
-        self.ble_mock.add_r_int(1326, 0)
-        # Grid P3 Current
-        self.ble_mock.add_r_int(1327, 0)
+        ble_mock.add_r_int(1300, 500)
+
+        # Grid P1 Power / Voltage / Current
+        ble_mock.add_r_ints(1313, [0, 0, 0])
+
+        # Grid P2 Power / Voltage / Current
+        ble_mock.add_r_ints(1319, [0, 0, 0])
+
+        # Grid P3 Power / Voltage / Current
+        ble_mock.add_r_ints(1325, [0, 0, 0])
 
         # AC Output Frequency
-        self.ble_mock.add_r_int(1500, 500)
-
-        # AC P1 Power
-        self.ble_mock.add_r_int(1510, 5)
-        # AC P1 Voltage
-        self.ble_mock.add_r_int(1511, 0)
-        # AC P1 Current
-        self.ble_mock.add_r_int(1512, 0)
-
-        # AC P2 Power
-        self.ble_mock.add_r_int(1517, 77)
-        # AC P2 Voltage
-        self.ble_mock.add_r_int(1518, 0)
-        # AC P2 Current
-        self.ble_mock.add_r_int(1519, 0)
-
-        # AC P3 Power
-        self.ble_mock.add_r_int(1524, 9)
-        # AC P3 Voltage
-        self.ble_mock.add_r_int(1525, 0)
-        # AC P3 Current
-        self.ble_mock.add_r_int(1526, 0)
+        ble_mock.add_r_int(1500, 500)
+
+        # AC P1 Power / Voltage / Current
+        ble_mock.add_r_ints(1510, [5, 0, 0])
+
+        # AC P2 Power / Voltage / Current
+        ble_mock.add_r_ints(1517, [77, 0, 0])
+
+        # AC P3 Power / Voltage / Current
+        ble_mock.add_r_ints(1524, [9, 0, 0])
 
         # Control AC
-        self.ble_mock.add_r_int(2011, 1)
+        ble_mock.add_r_int(2011, 1)
 
-        # Battery SOC Range Start
-        self.ble_mock.add_r_int(2022, 20)
-        # Battery SOC Range End
-        self.ble_mock.add_r_int(2023, 80)
+        # Battery SOC Range Start / End
+        ble_mock.add_r_ints(2022, [20, 80])
 
         # Control Generator
-        self.ble_mock.add_r_int(2246, 0)
-
-        # Grid Volt Min Val
-        self.ble_mock.add_r_int(2435, 200)
-        # Grid Volt Max Val
-        self.ble_mock.add_r_int(2436, 245)
+        ble_mock.add_r_int(2246, 0)
 
-        # Grid Freq Min Val
-        self.ble_mock.add_r_int(2437, 4800)
-        # Grid Freq Max Val
-        self.ble_mock.add_r_int(2438, 5200)
+        # Grid Volt Min / Max, Grid Freq Min / Max
+        ble_mock.add_r_ints(2435, [200, 245, 4800, 5200])
 
         # WiFi SSID
-        self.ble_mock.add_r_sstr(12002, "MyHomeSSID", 16)
+        ble_mock.add_r_sstr(12002, "MyHomeSSID", 16)
+
+        return ble_mock
 
     async def test_ep600(self):
         device = EP600()
@@ -137,70 +144,7 @@ class TestEP600(unittest.IsolatedAsyncioTestCase):
 
         self.assertIsNotNone(data)
 
-        self.assertEqual(data.get(FieldName.POWER_GENERATION.value), Decimal("350.5"))
-
-        self.assertEqual(data.get(FieldName.PV_S1_POWER.value), 1200)
-        self.assertEqual(data.get(FieldName.PV_S1_VOLTAGE.value), Decimal("45.0"))
-        self.assertEqual(data.get(FieldName.PV_S1_CURRENT.value), Decimal("26.6"))
-
-        self.assertEqual(data.get(FieldName.PV_S2_POWER.value), 2300)
-        self.assertEqual(data.get(FieldName.PV_S2_VOLTAGE.value), Decimal("48.0"))
-        self.assertEqual(data.get(FieldName.PV_S2_CURRENT.value), Decimal("47.9"))
-
-        self.assertEqual(data.get(FieldName.SM_P1_POWER.value), 0)
-        self.assertEqual(data.get(FieldName.SM_P1_VOLTAGE.value), 0)
-        self.assertEqual(data.get(FieldName.SM_P1_CURRENT.value), 0)
-
-        self.assertEqual(data.get(FieldName.SM_P2_POWER.value), 0)
-        self.assertEqual(data.get(FieldName.SM_P2_VOLTAGE.value), 0)
-        self.assertEqual(data.get(FieldName.SM_P2_CURRENT.value), 0)
-
-        self.assertEqual(data.get(FieldName.SM_P3_POWER.value), 0)
-        self.assertEqual(data.get(FieldName.SM_P3_VOLTAGE.value), 0)
-        self.assertEqual(data.get(FieldName.SM_P3_CURRENT.value), 0)
-
-        self.assertEqual(data.get(FieldName.GRID_FREQUENCY.value), Decimal("50.0"))
-
-        self.assertEqual(data.get(FieldName.GRID_P1_POWER.value), 0)
-        self.assertEqual(data.get(FieldName.GRID_P1_VOLTAGE.value), 0)
-        self.assertEqual(data.get(FieldName.GRID_P1_CURRENT.value), 0)
-
-        self.assertEqual(data.get(FieldName.GRID_P2_POWER.value), 0)
-        self.assertEqual(data.get(FieldName.GRID_P2_VOLTAGE.value), 0)
-        self.assertEqual(data.get(FieldName.GRID_P2_CURRENT.value), 0)
-
-        self.assertEqual(data.get(FieldName.GRID_P3_POWER.value), 0)
-        self.assertEqual(data.get(FieldName.GRID_P3_VOLTAGE.value), 0)
-        self.assertEqual(data.get(FieldName.GRID_P3_CURRENT.value), 0)
-
-        self.assertEqual(data.get(FieldName.AC_OUTPUT_FREQUENCY.value), Decimal("50.0"))
-
-        self.assertEqual(data.get(FieldName.AC_P1_POWER.value), 5)
-        self.assertEqual(data.get(FieldName.AC_P1_VOLTAGE.value), 0)
-        self.assertEqual(data.get(FieldName.AC_P1_CURRENT.value), 0)
-
-        self.assertEqual(data.get(FieldName.AC_P2_POWER.value), 77)
-        self.assertEqual(data.get(FieldName.AC_P2_VOLTAGE.value), 0)
-        self.assertEqual(data.get(FieldName.AC_P2_CURRENT.value), 0)
-
-        self.assertEqual(data.get(FieldName.AC_P3_POWER.value), 9)
-        self.assertEqual(data.get(FieldName.AC_P3_VOLTAGE.value), 0)
-        self.assertEqual(data.get(FieldName.AC_P3_CURRENT.value), 0)
-
-        self.assertEqual(data.get(FieldName.CTRL_AC.value), True)
-
-        self.assertEqual(data.get(FieldName.BATTERY_SOC_RANGE_START.value), 20)
-        self.assertEqual(data.get(FieldName.BATTERY_SOC_RANGE_END.value), 80)
-
-        self.assertEqual(data.get(FieldName.CTRL_GENERATOR.value), False)
-
-        self.assertEqual(data.get(FieldName.GRID_VOLT_MIN_VAL.value), Decimal("20.0"))
-        self.assertEqual(data.get(FieldName.GRID_VOLT_MAX_VAL.value), Decimal("24.5"))
-
-        self.assertEqual(data.get(FieldName.GRID_FREQ_MIN_VALUE.value), Decimal("48"))
-        self.assertEqual(data.get(FieldName.GRID_FREQ_MAX_VALUE.value), Decimal("52"))
-
-        self.assertEqual(data.get(FieldName.WIFI_NAME.value), "MyHomeSSID")
+        self.assertEqual({k: data.get(k) for k in EXPECTED_DATA}, EXPECTED_DATA)
 
     async def test_ep600_invalid_bool(self):
         self.ble_mock.add_r_int(2011, 5)